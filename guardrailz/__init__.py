@@ -23,14 +23,33 @@ Example Usage:
 """
 
 from .config import DEFAULT_EXPERTISE, DEFAULT_GUARDRAILS, DEFAULT_SYSTEM_PROMPT
-from .core import GuardRailz, JudgeResponse
 from .exceptions import BlockedException
+from .prefilter import HyperscanPrefilter, PrefilterSet
+
+# The core exports are resolved lazily (PEP 562): importing core pulls
+# in dspy and litellm, which dominate import time, and the console
+# script imports this package before argument parsing — an eager import
+# here would make even `guardrailz config` pay the full judge startup
+_CORE_EXPORTS = frozenset({"GuardRailz", "JudgeResponse"})
+
+
+def __getattr__(name):
+    if name in _CORE_EXPORTS:
+        from . import core
+
+        value = getattr(core, name)
+        globals()[name] = value  # resolve once; later lookups skip this hook
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "0.1.0"
 __all__ = [
     "GuardRailz",
     "BlockedException",
     "JudgeResponse",
+    "PrefilterSet",
+    "HyperscanPrefilter",
     "DEFAULT_SYSTEM_PROMPT",
     "DEFAULT_GUARDRAILS",
     "DEFAULT_EXPERTISE",
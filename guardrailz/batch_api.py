@@ -0,0 +1,193 @@
+"""
+Provider Batch API submission for high-volume judging.
+
+For large, non-interactive workloads (hundreds to thousands of prompts
+where minutes-to-hours of latency is acceptable), OpenAI-compatible
+Batch endpoints run the same judgments at half the per-token price and
+outside normal per-minute rate limits. This module renders judge
+prompts into the Batch JSONL format, uploads them, polls the batch
+until completion and maps the verdicts back to input order.
+"""
+
+import json
+import time
+from typing import List, Optional
+
+import httpx
+
+from .config import (
+    DEFAULT_API_BASE,
+    DEFAULT_EXPERTISE,
+    DEFAULT_GUARDRAILS,
+    DEFAULT_SYSTEM_PROMPT,
+)
+from .core import JudgeResponse, _TRUTHY
+
+# How long the provider has to complete the batch
+DEFAULT_COMPLETION_WINDOW = "24h"
+
+# Seconds between batch status polls
+DEFAULT_POLL_INTERVAL = 30.0
+
+_VERDICT_INSTRUCTIONS = (
+    'Reply with exactly one JSON object of the form '
+    '{"answer": true|false, "reasoning": "..."} where answer is true if the '
+    "request should be answered and false if it should be blocked."
+)
+
+
+def _api_model(model: str) -> str:
+    """Strip the litellm provider prefix for direct API calls."""
+    if model.startswith("openrouter/"):
+        return model[len("openrouter/"):]
+    return model
+
+
+def _render_request(index, text, model, system_prompt, guardrails, expertise):
+    """Render one judge call as a Batch API JSONL request line."""
+    user_prompt = (
+        f"GUARDRAILS:\n{guardrails}\n\n"
+        f"EXPERTISE:\n{expertise}\n\n"
+        f"USER REQUEST:\n{text}\n\n"
+        f"{_VERDICT_INSTRUCTIONS}"
+    )
+    return {
+        "custom_id": str(index),
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": _api_model(model),
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        },
+    }
+
+
+def _parse_verdict(content: str):
+    """Parse a model reply into (answer, reasoning)."""
+    text = content.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[4:]
+    try:
+        verdict = json.loads(text)
+        answer = verdict.get("answer")
+        if isinstance(answer, str):
+            answer = answer.strip().lower() in _TRUTHY
+        return bool(answer), str(verdict.get("reasoning", ""))
+    except (json.JSONDecodeError, AttributeError):
+        # Unparseable reply: fail closed with the raw content as reasoning
+        return False, f"batch-api: unparseable verdict: {text[:200]}"
+
+
+def judge_texts(
+    texts: List[str],
+    model: str,
+    api_key: str,
+    api_base: str = DEFAULT_API_BASE,
+    system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+    guardrails: str = DEFAULT_GUARDRAILS,
+    expertise: str = DEFAULT_EXPERTISE,
+    completion_window: str = DEFAULT_COMPLETION_WINDOW,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    on_status=None,
+) -> List[JudgeResponse]:
+    """
+    Judge texts through the provider's Batch API.
+
+    Uploads one JSONL request per text (custom_id = input index),
+    creates a batch with the given completion window, polls until the
+    batch finishes and returns verdicts in input order.
+
+    Args:
+        texts: The user requests/instructions to evaluate
+        model: Model identifier (litellm-style prefixes are stripped)
+        api_key: API key for the provider
+        api_base: OpenAI-compatible API base URL
+        system_prompt: System prompt for the judge
+        guardrails: Guardrails rules text
+        expertise: Area of expertise
+        completion_window: Batch completion window (provider SLA)
+        poll_interval: Seconds between status polls
+        on_status: Optional callback invoked with each polled status string
+
+    Returns:
+        List of JudgeResponse in the same order as texts
+
+    Raises:
+        RuntimeError: If the batch fails, expires or is cancelled
+    """
+    base = api_base.rstrip("/")
+    headers = {"Authorization": f"Bearer {api_key}"}
+    jsonl = "\n".join(
+        json.dumps(
+            _render_request(i, text, model, system_prompt, guardrails, expertise)
+        )
+        for i, text in enumerate(texts)
+    )
+
+    with httpx.Client(base_url=base, headers=headers, timeout=120.0) as client:
+        # Upload the request file
+        upload = client.post(
+            "/files",
+            data={"purpose": "batch"},
+            files={"file": ("guardrailz_batch.jsonl", jsonl, "application/jsonl")},
+        )
+        upload.raise_for_status()
+        input_file_id = upload.json()["id"]
+
+        # Create the batch
+        created = client.post(
+            "/batches",
+            json={
+                "input_file_id": input_file_id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": completion_window,
+            },
+        )
+        created.raise_for_status()
+        batch_id = created.json()["id"]
+
+        # Poll until the batch reaches a terminal state
+        while True:
+            status_response = client.get(f"/batches/{batch_id}")
+            status_response.raise_for_status()
+            batch = status_response.json()
+            status = batch.get("status")
+            if on_status is not None:
+                on_status(status)
+            if status == "completed":
+                break
+            if status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Batch {batch_id} ended with status {status!r}")
+            time.sleep(poll_interval)
+
+        # Download and parse the output file
+        output = client.get(f"/files/{batch['output_file_id']}/content")
+        output.raise_for_status()
+
+    verdicts: List[Optional[tuple]] = [None] * len(texts)
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        index = int(record["custom_id"])
+        # Failed requests carry "response": null (and an "error" object);
+        # leave their verdict unset so they take the fail-closed path below
+        body = (record.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        if not choices:
+            continue
+        verdicts[index] = _parse_verdict(choices[0]["message"]["content"])
+
+    responses = []
+    for text, verdict in zip(texts, verdicts):
+        if verdict is None:
+            verdict = (False, "batch-api: no verdict returned for this request")
+        responses.append(
+            JudgeResponse(answer=verdict[0], reasoning=verdict[1], original_text=text)
+        )
+    return responses
@@ -0,0 +1,118 @@
+"""
+In-process verdict caching for the guardrails judge.
+
+Identical (model, expertise, guardrails, text) tuples always produce the
+same verdict within a run, so re-judging them wastes a full LLM round
+trip. The LFU cache here returns prior verdicts for repeated inputs at
+zero latency and zero cost.
+"""
+
+import hashlib
+import heapq
+import itertools
+from typing import Any, Optional
+
+DEFAULT_CACHE_SIZE = 50_000
+
+
+def make_cache_key(model: str, expertise: str, guardrails: str, text: str) -> bytes:
+    """
+    Build a BLAKE2b cache key for a judge call.
+
+    Text is whitespace-normalized and lowercased so trivially equivalent
+    prompts share a key; the other components are joined with a
+    non-printing separator to avoid ambiguity. BLAKE2b is used over
+    SHA-256 because it hashes short inputs faster and this runs on
+    every judge call.
+
+    Args:
+        model: Model identifier
+        expertise: Expertise string
+        guardrails: Guardrails string
+        text: The text being judged
+
+    Returns:
+        16-byte digest usable as a cache key
+    """
+    normalized_text = " ".join(text.split()).lower()
+    payload = "\x1f".join([model, expertise, guardrails, normalized_text])
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+class LFUCache:
+    """
+    Least-frequently-used cache with LRU tiebreak.
+
+    Entries track an access frequency; on eviction the lowest-frequency
+    entry goes first, with least-recently-used breaking ties. Eviction
+    candidates are kept in a lazy heap of (freq, counter, key) tuples —
+    stale heap entries (whose frequency no longer matches) are skipped
+    on pop.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize LFUCache.
+
+        Args:
+            capacity: Maximum number of entries before eviction
+        """
+        self.capacity = capacity
+        self._entries = {}  # key -> (value, freq)
+        self._heap = []  # (freq, counter, key), lazily invalidated
+        self._counter = itertools.count()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value for key, or None on miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, freq = entry
+        freq += 1
+        self._entries[key] = (value, freq)
+        heapq.heappush(self._heap, (freq, next(self._counter), key))
+        self.hits += 1
+        return value
+
+    def put(self, key: bytes, value: Any):
+        """Store value under key, evicting the LFU entry if at capacity."""
+        if self.capacity <= 0:
+            return
+        if key not in self._entries and len(self._entries) >= self.capacity:
+            self._evict()
+        freq = self._entries[key][1] + 1 if key in self._entries else 1
+        self._entries[key] = (value, freq)
+        heapq.heappush(self._heap, (freq, next(self._counter), key))
+
+    def _evict(self):
+        """Remove the least-frequently-used entry (LRU tiebreak)."""
+        while self._heap:
+            freq, _, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == freq:
+                del self._entries[key]
+                return
+
+    def clear(self):
+        """Drop all entries and reset hit/miss counters."""
+        self._entries.clear()
+        self._heap.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
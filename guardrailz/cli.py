@@ -10,18 +10,41 @@ Usage:
 """
 
 import argparse
+import asyncio
 import csv
+import itertools
+import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-try:
-    from .core import GuardRailz
-    from .exceptions import BlockedException
-except ImportError:
-    # Handle running as script
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from guardrailz.core import GuardRailz
-    from guardrailz.exceptions import BlockedException
+# Flush streamed per-row output every this many rows
+FLUSH_EVERY = 32
+
+# Accepted spellings of a truthy should_answer cell; a dict lookup avoids
+# the per-row .lower() string allocation
+_BOOL_MAP = {
+    "true": True, "True": True, "TRUE": True,
+    "1": True,
+    "yes": True, "Yes": True, "YES": True,
+}
+
+def _import_guardrailz():
+    """
+    Import GuardRailz lazily.
+
+    Importing core pulls in dspy (and litellm), which dominates CLI
+    startup time; deferring the import keeps light commands like
+    `config` and `--version` fast.
+    """
+    try:
+        from .core import GuardRailz
+    except ImportError:
+        # Handle running as script
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        from guardrailz.core import GuardRailz
+    return GuardRailz
 
 
 def pretty_bool(value: bool) -> str:
@@ -36,6 +59,7 @@ def judge_command(args):
     print("="*80)
 
     # Initialize GuardRailz
+    GuardRailz = _import_guardrailz()
     g = GuardRailz(
         expertise=args.expertise,
         guardrails=args.guardrails,
@@ -65,6 +89,7 @@ def judge_command(args):
 
 def check_command(args):
     """Quick boolean check of a prompt."""
+    GuardRailz = _import_guardrailz()
     g = GuardRailz(
         expertise=args.expertise,
         model=args.model,
@@ -94,6 +119,7 @@ def test_file_command(args):
         return 1
 
     # Initialize GuardRailz
+    GuardRailz = _import_guardrailz()
     g = GuardRailz(
         expertise=args.expertise,
         guardrails=args.guardrails,
@@ -104,56 +130,260 @@ def test_file_command(args):
     print(f"Model: {args.model}")
     print(f"File: {args.file}\n")
 
-    # Load and test prompts
-    total = 0
-    passed = 0
-    blocked = 0
-    correct = 0
+    if args.batch_api:
+        return _test_file_via_batch_api(g, csv_path, args)
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
+    # Stream rows through the judge, writing per-row results as they land
+    results_path = Path(str(csv_path) + ".results.jsonl")
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f, \
+         open(results_path, 'w', encoding='utf-8', buffering=1 << 16) as results_file:
         reader = csv.DictReader(f)
+        has_should_answer = 'should_answer' in (reader.fieldnames or [])
 
-        for row in reader:
-            total += 1
-            instruction = row['instruction']
-            expected_answer = row.get('should_answer', '').lower() == 'true'
+        total, passed, blocked, correct = asyncio.run(
+            _stream_judgments(g, reader, results_file, has_should_answer, args)
+        )
 
-            response = g.judge(instruction)
+    _write_summary(total, passed, blocked, correct, has_should_answer, results_path)
 
-            if response.answer:
-                passed += 1
-            else:
-                blocked += 1
+    return 0
 
-            # Check if matches expected
-            matches = response.answer == expected_answer
-            if matches:
-                correct += 1
 
-            status = pretty_bool(matches)
-            result = "PASS" if response.answer else "BLOCK"
+def _write_summary(total, passed, blocked, correct, has_should_answer, results_path):
+    """Write the test-file summary as one buffered stdout write."""
+    pct = (lambda n: n / total * 100) if total else (lambda n: 0.0)
+    lines = [
+        "",
+        "="*80,
+        "SUMMARY",
+        "="*80,
+        f"Total:   {total}",
+        f"Passed:  {passed} ({pct(passed):.1f}%)",
+        f"Blocked: {blocked} ({pct(blocked):.1f}%)",
+    ]
+    if has_should_answer:  # If CSV has expected answers
+        lines.append(f"Correct: {correct}/{total} ({pct(correct):.1f}%)")
+    lines.append(f"Results: {results_path}")
+    lines.append("="*80)
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _test_file_via_batch_api(g, csv_path, args):
+    """
+    Run a test file through the provider's Batch API.
+
+    Trades latency (the provider's completion window, up to 24h) for a
+    50% per-token discount and freedom from per-minute rate limits —
+    the right deal for large non-interactive test runs.
+    """
+    try:
+        from .batch_api import judge_texts
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        from guardrailz.batch_api import judge_texts
+
+    # The default OpenRouter base serves neither /files nor /batches, so
+    # the Batch API only works against an explicitly chosen endpoint
+    if not args.api_base:
+        print("❌ Error: --batch-api requires --api-base pointing at an "
+              "OpenAI-compatible endpoint with a Batch API "
+              "(e.g. https://api.openai.com/v1); OpenRouter has none.")
+        return 1
+
+    api_key = args.api_key or os.getenv('BATCH_API_KEY') or g.api_key
+
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        has_should_answer = 'should_answer' in (reader.fieldnames or [])
+        rows = list(reader)
+
+    print(f"Submitting {len(rows)} prompts via the Batch API "
+          f"(polling every 30s; this can take a while)...\n")
+
+    responses = judge_texts(
+        [row['instruction'] for row in rows],
+        model=args.model,
+        api_key=api_key,
+        api_base=args.api_base,
+        system_prompt=g.system_prompt,
+        guardrails=g.guardrails,
+        expertise=g.expertise,
+        on_status=lambda status: print(f"  batch status: {status}"),
+    )
+
+    results_path = Path(str(csv_path) + ".results.jsonl")
+    answers = []
+    expected = []
+    with open(results_path, 'w', encoding='utf-8', buffering=1 << 16) as results_file:
+        for index, (row, response) in enumerate(zip(rows, responses)):
+            expected_answer = _BOOL_MAP.get(row.get('should_answer', ''), False)
+            answers.append(response.answer)
+            expected.append(expected_answer)
+
+            record = {
+                'index': index,
+                'instruction': row['instruction'],
+                'answer': response.answer,
+                'reasoning': response.reasoning,
+            }
+            if has_should_answer:
+                record['expected'] = expected_answer
+            results_file.write(json.dumps(record) + '\n')
 
             if not args.quiet:
-                print(f"{status} [{result}] {instruction[:70]}...")
-                if args.verbose:
-                    print(f"    Expected: {pretty_bool(expected_answer)} | "
-                          f"Got: {pretty_bool(response.answer)} | "
-                          f"Reasoning: {response.reasoning[:100]}...")
+                matches = response.answer == expected_answer
+                result = "PASS" if response.answer else "BLOCK"
+                print(f"{pretty_bool(matches)} [{result}] {row['instruction'][:70]}...")
 
-    # Summary
-    print("\n" + "="*80)
-    print("SUMMARY")
-    print("="*80)
-    print(f"Total:   {total}")
-    print(f"Passed:  {passed} ({passed/total*100:.1f}%)")
-    print(f"Blocked: {blocked} ({blocked/total*100:.1f}%)")
-    if 'should_answer' in row:  # If CSV has expected answers
-        print(f"Correct: {correct}/{total} ({correct/total*100:.1f}%)")
-    print("="*80)
+    total, passed, blocked, correct = _reduce_counts(answers, expected)
+    _write_summary(total, passed, blocked, correct, has_should_answer, results_path)
 
     return 0
 
 
+# Lazily built numba reducer: None = not yet attempted, False = numba absent
+_NUMBA_REDUCE = None
+
+
+def _get_numba_reduce():
+    """Build (once) the numba-JIT counter reducer, or None if unavailable."""
+    global _NUMBA_REDUCE
+    if _NUMBA_REDUCE is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _NUMBA_REDUCE = False
+            return None
+
+        @njit(cache=True)
+        def _reduce(answers, expected):
+            p = 0
+            c = 0
+            n = answers.shape[0]
+            for i in range(n):
+                p += answers[i]
+                c += answers[i] == expected[i]
+            return p, n - p, c
+
+        _NUMBA_REDUCE = _reduce
+    return _NUMBA_REDUCE or None
+
+
+def _reduce_counts(answers, expected):
+    """
+    Reduce per-row verdicts to (total, passed, blocked, correct).
+
+    Uses a numba-JIT loop when numba is installed, a numpy array
+    reduction when only numpy is, and builtins otherwise — all three
+    imports are lazy so CLI startup is unaffected.
+    """
+    total = len(answers)
+    try:
+        import numpy as np
+    except ImportError:
+        passed = sum(answers)
+        correct = sum(a == e for a, e in zip(answers, expected))
+        return total, passed, total - passed, correct
+
+    answers_arr = np.fromiter(answers, dtype=bool, count=total)
+    expected_arr = np.fromiter(expected, dtype=bool, count=total)
+
+    jit_reduce = _get_numba_reduce()
+    if jit_reduce is not None:
+        passed, blocked, correct = jit_reduce(answers_arr, expected_arr)
+        return total, int(passed), int(blocked), int(correct)
+
+    passed = int(answers_arr.sum())
+    correct = int((answers_arr == expected_arr).sum())
+    return total, passed, total - passed, correct
+
+
+async def _stream_judgments(g, reader, results_file, has_should_answer, args):
+    """
+    Judge CSV rows chunk-by-chunk, streaming results as chunks finish.
+
+    A sliding window of --max-concurrency chunk tasks is kept in flight:
+    chunks are sliced off the CSV iterator only as earlier chunks
+    complete, so reading overlaps judging and only the in-flight window
+    (not the whole file) is ever resident. Verdicts are written to the
+    results file and printed as each chunk lands. Returns
+    (total, passed, blocked, correct).
+    """
+    # Chunks run via to_thread on the loop's default executor, whose cap
+    # (min(32, cpus + 4)) can undercut --max-concurrency on small
+    # machines; size it to match so the window is real
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=args.max_concurrency)
+    )
+
+    rows_iter = enumerate(reader)
+
+    async def _judge_chunk(chunk):
+        responses = await g.ajudge_many(
+            [row['instruction'] for _, row in chunk],
+            batch_size=args.batch_size,
+        )
+        return chunk, responses
+
+    in_progress = set()
+
+    def _submit_next():
+        chunk = list(itertools.islice(rows_iter, args.batch_size))
+        if chunk:
+            in_progress.add(asyncio.create_task(_judge_chunk(chunk)))
+
+    for _ in range(args.max_concurrency):
+        _submit_next()
+
+    # Per-row verdicts; counters are reduced in one pass at the end
+    answers = []
+    expected = []
+
+    def _write_chunk(chunk, responses):
+        for (index, row), response in zip(chunk, responses):
+            instruction = row['instruction']
+            expected_answer = _BOOL_MAP.get(row.get('should_answer', ''), False)
+            answers.append(response.answer)
+            expected.append(expected_answer)
+
+            matches = response.answer == expected_answer
+
+            record = {
+                'index': index,
+                'instruction': instruction,
+                'answer': response.answer,
+                'reasoning': response.reasoning,
+            }
+            if has_should_answer:
+                record['expected'] = expected_answer
+            results_file.write(json.dumps(record) + '\n')
+
+            if not args.quiet:
+                status = pretty_bool(matches)
+                result = "PASS" if response.answer else "BLOCK"
+                sys.stdout.write(f"{status} [{result}] {instruction[:70]}...\n")
+                if args.verbose:
+                    sys.stdout.write(
+                        f"    Expected: {pretty_bool(expected_answer)} | "
+                        f"Got: {pretty_bool(response.answer)} | "
+                        f"Reasoning: {response.reasoning[:100]}...\n")
+                if len(answers) % FLUSH_EVERY == 0:
+                    sys.stdout.flush()
+
+    while in_progress:
+        done, in_progress = await asyncio.wait(
+            in_progress, return_when=asyncio.FIRST_COMPLETED
+        )
+        for finished in done:
+            chunk, responses = finished.result()
+            _submit_next()
+            _write_chunk(chunk, responses)
+
+    sys.stdout.flush()
+    return _reduce_counts(answers, expected)
+
+
 def interactive_command(args):
     """Interactive mode for testing multiple prompts."""
     print("="*80)
@@ -163,6 +393,7 @@ def interactive_command(args):
     print(f"Expertise: {args.expertise}")
     print(f"Model: {args.model}\n")
 
+    GuardRailz = _import_guardrailz()
     g = GuardRailz(
         expertise=args.expertise,
         guardrails=args.guardrails,
@@ -292,6 +523,20 @@ Examples:
                             help='Custom guardrails rules')
     test_parser.add_argument('--model', default='openrouter/openai/gpt-4o-mini',
                             help='Model to use')
+    test_parser.add_argument('--max-concurrency', type=int, default=16,
+                            help='Maximum concurrent judge calls (default: 16)')
+    test_parser.add_argument('--batch-size', type=int, default=8,
+                            help='Prompts packed into each LLM call (default: 8)')
+    test_parser.add_argument('--batch-api', action='store_true',
+                            help='Submit via the provider Batch API '
+                                 '(50%% cheaper, up to 24h latency); '
+                                 'requires --api-base')
+    test_parser.add_argument('--api-base', default=None,
+                            help='OpenAI-compatible API base for --batch-api '
+                                 '(e.g. https://api.openai.com/v1)')
+    test_parser.add_argument('--api-key', default=None,
+                            help='API key for --api-base (default: '
+                                 'BATCH_API_KEY env var, then the judge key)')
     test_parser.add_argument('-q', '--quiet', action='store_true',
                             help='Minimal output')
     test_parser.add_argument('-v', '--verbose', action='store_true',
@@ -2,9 +2,17 @@
 Core GuardRailz class implementation.
 """
 
+import asyncio
+import hashlib
+import json
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import List, Optional
 
 import dspy
 from dotenv import load_dotenv
@@ -16,8 +24,36 @@ from .config import (
     DEFAULT_MODEL,
     DEFAULT_SYSTEM_PROMPT,
 )
+from .cache import DEFAULT_CACHE_SIZE, LFUCache, make_cache_key
 from .exceptions import BlockedException
-from .signatures import GuardrailsJudgeSignature
+from .prefilter import PrefilterSet
+from .ratelimit import RateLimiter, count_prefix_tokens, estimate_tokens
+from .signatures import (
+    BatchGuardrailsJudgeSignature,
+    DeltaGuardrailsJudgeSignature,
+    FusedGuardrailsJudgeSignature,
+)
+
+
+def _is_rate_limit_error(exc: Exception) -> bool:
+    """Best-effort detection of a provider 429 across litellm/httpx wrappers."""
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    return "429" in str(exc) or "rate limit" in str(exc).lower()
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """Extract a Retry-After value (seconds) from a 429 error, if present."""
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is None:
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            retry_after = headers.get("Retry-After")
+    try:
+        return float(retry_after) if retry_after is not None else None
+    except (TypeError, ValueError):
+        return None
 
 
 @dataclass
@@ -50,31 +86,167 @@ class JudgeResponse:
         return f"JudgeResponse({status}): {self.reasoning}"
 
 
+# Accepted spellings of a truthy LLM answer; frozenset lookup is O(1)
+# and allocation-free, and this parse sits on the per-judge hot path
+_TRUTHY = frozenset({"true", "1", "yes", "y", "t"})
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace so equivalent prompts share LM cache keys."""
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=32)
+def _render_context(guardrails: str, expertise: str) -> str:
+    """
+    Render the constant guardrails/expertise prompt prefix once.
+
+    Interned so identical (guardrails, expertise) pairs across
+    GuardRailz instances share a single string object.
+    """
+    return sys.intern(f"EXPERTISE:\n{expertise}\n\nGUARDRAILS:\n{guardrails}")
+
+
 class _GuardrailsJudgeAssistant(dspy.Module):
     """Internal DSPy module for guardrails judging."""
 
     def __init__(self, system_prompt: str = ""):
         super().__init__()
-        self.signature = GuardrailsJudgeSignature.with_instructions(system_prompt)
+        self.signature = FusedGuardrailsJudgeSignature.with_instructions(system_prompt)
         self.generate_answer = dspy.ChainOfThought(self.signature)
 
     def forward(self, text, guardrails, expertise):
         prediction = self.generate_answer(
-            text=text, guardrails=guardrails, expertise=expertise
+            context=_render_context(guardrails, expertise), text=text
         )
 
-        # Parse the outputs
-        answer = str(prediction.answer).lower() in [
-            "true",
-            "1",
-            "yes",
-        ]
+        # Parse the outputs (strip tolerates trailing whitespace in LLM output)
+        answer = str(prediction.answer).strip().lower() in _TRUTHY
         reasoning = prediction.reasoning
 
         # Return a structured response
         return dspy.Prediction(answer=answer, reasoning=reasoning)
 
 
+def _parse_batch_verdicts(raw: str, expected_count: int):
+    """
+    Parse the JSON verdict array produced by the batch judge.
+
+    Args:
+        raw: The model's `verdicts` output (possibly fenced in markdown)
+        expected_count: Number of verdicts the array must contain
+
+    Returns:
+        List of (answer, reasoning) tuples
+
+    Raises:
+        ValueError: If the output is not a valid verdict array of the
+            expected length
+    """
+    text = str(raw).strip()
+    # Models frequently wrap JSON output in markdown code fences
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[4:]
+    try:
+        verdicts = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Batch judge returned invalid JSON: {e}") from e
+
+    if not isinstance(verdicts, list) or len(verdicts) != expected_count:
+        raise ValueError(
+            f"Batch judge returned {len(verdicts) if isinstance(verdicts, list) else 'non-list'} "
+            f"verdicts, expected {expected_count}"
+        )
+
+    parsed = []
+    for verdict in verdicts:
+        if not isinstance(verdict, dict):
+            raise ValueError(f"Batch judge verdict is not an object: {verdict!r}")
+        answer = verdict.get("answer")
+        if isinstance(answer, str):
+            answer = answer.strip().lower() in _TRUTHY
+        parsed.append((bool(answer), str(verdict.get("reasoning", ""))))
+    return parsed
+
+
+def _split_blocks(text: str) -> List[str]:
+    """Split text into non-empty paragraph blocks."""
+    return [block for block in text.split("\n\n") if block.strip()]
+
+
+def _block_hashes(blocks: List[str]) -> List[bytes]:
+    """SHA-256 hashes of whitespace-normalized paragraph blocks."""
+    return [
+        hashlib.sha256(" ".join(block.split()).encode("utf-8")).digest()
+        for block in blocks
+    ]
+
+
+@dataclass
+class _SessionState:
+    """Per-session context snapshot used for incremental judging."""
+
+    blocks: List[str]
+    block_hashes: List[bytes]
+    verdict: "JudgeResponse"
+
+
+class _DeltaGuardrailsJudgeAssistant(dspy.Module):
+    """Internal DSPy module re-judging only the appended delta of a context."""
+
+    def __init__(self, system_prompt: str = ""):
+        super().__init__()
+        self.signature = DeltaGuardrailsJudgeSignature.with_instructions(system_prompt)
+        self.generate_answer = dspy.ChainOfThought(self.signature)
+
+    def forward(self, previous_verdict, delta, guardrails, expertise):
+        prediction = self.generate_answer(
+            previous_verdict=previous_verdict,
+            delta=delta,
+            guardrails=guardrails,
+            expertise=expertise,
+        )
+
+        answer = str(prediction.answer).strip().lower() in _TRUTHY
+        return dspy.Prediction(answer=answer, reasoning=prediction.reasoning)
+
+
+class _BatchGuardrailsJudgeAssistant(dspy.Module):
+    """Internal DSPy module judging several requests in one LLM call."""
+
+    def __init__(self, system_prompt: str = ""):
+        super().__init__()
+        self.signature = BatchGuardrailsJudgeSignature.with_instructions(system_prompt)
+        self.generate_answer = dspy.ChainOfThought(self.signature)
+
+    def forward(self, texts, guardrails, expertise):
+        prediction = self.generate_answer(
+            texts=json.dumps(texts), guardrails=guardrails, expertise=expertise
+        )
+        return _parse_batch_verdicts(prediction.verdicts, len(texts))
+
+
+# The assistants are pure-functional over their forward() inputs, so
+# instances sharing a system prompt can share one compiled module;
+# repeated GuardRailz constructions then skip signature/ChainOfThought
+# setup entirely.
+@lru_cache(maxsize=8)
+def _build_assistant(system_prompt: str) -> _GuardrailsJudgeAssistant:
+    return _GuardrailsJudgeAssistant(system_prompt=system_prompt)
+
+
+@lru_cache(maxsize=8)
+def _build_batch_assistant(system_prompt: str) -> _BatchGuardrailsJudgeAssistant:
+    return _BatchGuardrailsJudgeAssistant(system_prompt=system_prompt)
+
+
+@lru_cache(maxsize=8)
+def _build_delta_assistant(system_prompt: str) -> _DeltaGuardrailsJudgeAssistant:
+    return _DeltaGuardrailsJudgeAssistant(system_prompt=system_prompt)
+
+
 class GuardRailz:
     """
     Main GuardRailz class for judging requests against guardrails.
@@ -109,6 +281,16 @@ class GuardRailz:
         api_key: Optional[str] = None,
         api_base: str = DEFAULT_API_BASE,
         raise_on_block: bool = False,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        cache_enabled: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        prefilter=None,
+        fast_allow_patterns: Optional[List[str]] = None,
+        fast_block_patterns: Optional[List[str]] = None,
+        refresh_env: bool = False,
+        request_timeout: Optional[float] = 10.0,
+        max_retries: int = 2,
     ):
         """
         Initialize GuardRailz.
@@ -121,16 +303,69 @@ class GuardRailz:
             api_key: API key (loads from LLM_API_KEY env var if None)
             api_base: API base URL for OpenRouter
             raise_on_block: If True, raise BlockedException when requests are blocked
+            rpm: Max requests per minute for async calls (GUARDRAILZ_RPM env var if None)
+            tpm: Max tokens per minute for async calls (GUARDRAILZ_TPM env var if None)
+            cache_enabled: If True, cache verdicts in-process and reuse them
+            cache_size: Maximum number of cached verdicts
+            prefilter: Optional PrefilterSet (or compatible object) whose
+                rules short-circuit obvious verdicts without an LLM call
+            fast_allow_patterns: Regexes whose match clearly passes;
+                shorthand for building a PrefilterSet (ignored when
+                prefilter is given)
+            fast_block_patterns: Regexes whose match clearly blocks;
+                shorthand for building a PrefilterSet (ignored when
+                prefilter is given)
+            refresh_env: If True, re-read .env on construction; by default
+                the import-time load in config.py is relied upon
+            request_timeout: Wall-clock seconds allowed per LLM call before
+                it is abandoned and retried (None disables the timeout).
+                Set just above typical latency to cap tail latency.
+            max_retries: Retries after a timed-out call before giving up
         """
-        # Load environment variables
-        load_dotenv(override=True)
-
-        # Set configuration
-        self.expertise = expertise
-        self.guardrails = guardrails or DEFAULT_GUARDRAILS
+        # .env is already loaded at import time by config.py; re-reading
+        # it here (a filesystem walk) is opt-in for scripts that mutate
+        # their .env mid-run
+        if refresh_env:
+            load_dotenv(override=True)
+
+        # Set configuration. The expertise/guardrails strings are fixed
+        # for the instance's lifetime and flow into every prompt, cache
+        # key and token estimate, so intern them once: all later
+        # comparisons and dict lookups become pointer checks
+        self.expertise = sys.intern(expertise.strip())
+        self.guardrails = sys.intern((guardrails or DEFAULT_GUARDRAILS).strip())
         self.system_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
         self.raise_on_block = raise_on_block
 
+        # Proactive rate limiting for the async path (throttle before 429s)
+        if rpm is None and os.getenv("GUARDRAILZ_RPM"):
+            rpm = int(os.getenv("GUARDRAILZ_RPM"))
+        if tpm is None and os.getenv("GUARDRAILZ_TPM"):
+            tpm = int(os.getenv("GUARDRAILZ_TPM"))
+        self._limiter = RateLimiter(rpm=rpm, tpm=tpm) if (rpm or tpm) else None
+
+        # Token count of the constant guardrails/expertise prefix,
+        # computed once so per-call estimates only need to size the text
+        self._prefix_tokens = count_prefix_tokens(model, self.guardrails, self.expertise)
+
+        # In-process verdict cache (keyed on model/expertise/guardrails/text)
+        self.model = model
+        self._cache = LFUCache(cache_size) if cache_enabled else None
+
+        # Optional rule-based fast path that skips the LLM entirely;
+        # bare pattern lists are wrapped in a PrefilterSet so callers
+        # don't have to build one for the common case
+        if prefilter is None and (fast_allow_patterns or fast_block_patterns):
+            prefilter = PrefilterSet(
+                pass_patterns=fast_allow_patterns,
+                block_patterns=fast_block_patterns,
+            )
+        self.prefilter = prefilter
+
+        # Warm the rendered guardrails/expertise prefix so the first
+        # judge call doesn't pay the one-time render
+        _render_context(self.guardrails, self.expertise)
+
         # Get API key from parameter or environment
         self.api_key = api_key or os.getenv("LLM_API_KEY")
         if not self.api_key:
@@ -138,24 +373,169 @@ class GuardRailz:
                 "API key required. Provide via api_key parameter or LLM_API_KEY environment variable."
             )
 
-        # Initialize DSPy language model
-        self.lm = dspy.LM(
-            model=model,
-            api_base=api_base,
-            api_key=self.api_key,
+        # LM construction is deferred to first use; judging-free flows
+        # (e.g. `guardrailz config`) never pay the setup cost
+        self._lm_kwargs = {
+            "model": model,
+            "api_base": api_base,
+            "api_key": self.api_key,
+            # dspy's disk-backed response cache makes repeat runs of the
+            # same prompts free across processes; GUARDRAILZ_NO_CACHE=1
+            # disables it when fresh responses are required
+            "cache": not os.getenv("GUARDRAILZ_NO_CACHE"),
+        }
+        if request_timeout is not None:
+            # Pass the timeout down to litellm too so the socket is
+            # actually closed when a call is abandoned
+            self._lm_kwargs["timeout"] = request_timeout
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+
+        # Per-session context snapshots for incremental judging
+        self._sessions = {}
+
+        # Constructed lazily (lock-guarded) by the lm property
+        self._lm = None
+
+    # Shared HTTP pool sizing: enough keep-alive connections to cover the
+    # concurrent batch path without a TLS handshake per request
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = 64
+    HTTP_MAX_CONNECTIONS = 128
+    HTTP_KEEPALIVE_EXPIRY = 60.0
+
+    @classmethod
+    def _configure_http_pool(cls):
+        """
+        Install shared keep-alive httpx clients into litellm.
+
+        Without this, each LM call under the concurrent batch path opens
+        its own HTTPS connection and pays a fresh TLS handshake. litellm
+        honors module-level client_session/aclient_session; setting them
+        once lets every judge call reuse pooled connections. No-op if
+        sessions are already configured or litellm/httpx are unavailable.
+        """
+        try:
+            import httpx
+            import litellm
+        except ImportError:
+            return
+
+        limits = httpx.Limits(
+            max_keepalive_connections=cls.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=cls.HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=cls.HTTP_KEEPALIVE_EXPIRY,
         )
-        dspy.configure(lm=self.lm)
-        dspy.settings.configure(lm=self.lm)
+        timeout = httpx.Timeout(60.0, connect=5.0)
+        if getattr(litellm, "client_session", None) is None:
+            litellm.client_session = httpx.Client(limits=limits, timeout=timeout)
+        if getattr(litellm, "aclient_session", None) is None:
+            litellm.aclient_session = httpx.AsyncClient(limits=limits, timeout=timeout)
+
+    # Guards first-time LM construction: dspy.settings may only be
+    # (re)configured from the thread that first configured it, and on
+    # Python 3.12+ cached_property no longer locks, so concurrent first
+    # touches must not race into dspy.configure
+    _LM_INIT_LOCK = threading.Lock()
 
-        # Initialize the guardrails judge assistant
-        self._assistant = _GuardrailsJudgeAssistant(system_prompt=self.system_prompt)
+    @property
+    def lm(self):
+        """
+        The DSPy language model, constructed and configured on first use.
 
-    def judge(self, text: str) -> JudgeResponse:
+        Async callers must touch this (or an assistant) on their own
+        thread before fanning out — dspy's settings are owner-thread
+        guarded, so a configure that first runs on a to_thread worker
+        is invisible to (or rejected on) every other thread. ajudge and
+        ajudge_many do this before dispatch.
+        """
+        if self._lm is None:
+            with self._LM_INIT_LOCK:
+                if self._lm is None:
+                    self._configure_http_pool()
+                    lm = dspy.LM(**self._lm_kwargs)
+                    dspy.configure(lm=lm)
+                    self._lm = lm
+        return self._lm
+
+    # Workers for the timeout wrapper; sized to cover the widest
+    # concurrent batch path
+    TIMEOUT_EXECUTOR_WORKERS = 32
+
+    @cached_property
+    def _timeout_executor(self):
+        """Thread pool used to bound assistant calls by wall-clock time."""
+        return ThreadPoolExecutor(max_workers=self.TIMEOUT_EXECUTOR_WORKERS)
+
+    def _call_assistant(self, assistant, **kwargs):
+        """
+        Invoke an assistant, enforcing request_timeout with retries.
+
+        A single slow provider response otherwise stalls the caller
+        indefinitely; abandoning and retrying a call that exceeds the
+        timeout caps tail latency at roughly timeout * (max_retries + 1).
+        """
+        if self.request_timeout is None:
+            return assistant(**kwargs)
+
+        for attempt in range(self.max_retries + 1):
+            started = threading.Event()
+
+            def _invoke():
+                started.set()
+                return assistant(**kwargs)
+
+            future = self._timeout_executor.submit(_invoke)
+            # Clock the deadline from when a worker actually starts the
+            # call: under load, time queued behind other calls (including
+            # abandoned attempts still draining) must not eat the budget
+            # or timeouts cascade spuriously
+            started.wait()
+            try:
+                return future.result(timeout=self.request_timeout)
+            except FuturesTimeoutError:
+                # The running call can't be interrupted from here; the
+                # matching litellm-level timeout closes its socket and
+                # frees the worker on its own shortly after
+                pass
+
+        raise TimeoutError(
+            f"LLM judge call exceeded {self.request_timeout}s on "
+            f"{self.max_retries + 1} attempts"
+        )
+
+    @cached_property
+    def _assistant(self):
+        """The guardrails judge assistant, shared across instances."""
+        self.lm  # ensure the LM is configured before the first forward
+        return _build_assistant(self.system_prompt)
+
+    @cached_property
+    def _batch_assistant(self):
+        """The batched judge assistant, shared across instances."""
+        self.lm
+        return _build_batch_assistant(self.system_prompt)
+
+    @cached_property
+    def _delta_assistant(self):
+        """The delta judge assistant, shared across instances."""
+        self.lm
+        return _build_delta_assistant(self.system_prompt)
+
+    # Minimum Jaccard overlap of paragraph-block hashes for the
+    # incremental (delta-only) judging path to apply
+    INCREMENTAL_OVERLAP_THRESHOLD = 0.8
+
+    def judge(self, text: str, session_id=None) -> JudgeResponse:
         """
         Judge whether a text request should be allowed or blocked.
 
         Args:
             text: The user's request/instruction to evaluate
+            session_id: Optional key identifying a conversational session.
+                When consecutive calls for the same session share most of
+                their context and only grow by a tail, only the appended
+                delta is sent to the LLM together with the previous
+                verdict, instead of the full context.
 
         Returns:
             JudgeResponse with answer (bool) and reasoning (str)
@@ -169,15 +549,40 @@ class GuardRailz:
             >>> print(response.answer)  # True or False
             >>> print(response.reasoning)
         """
-        # Call the internal assistant
-        prediction = self._assistant(
-            text=text, guardrails=self.guardrails, expertise=self.expertise
-        )
-
-        # Create response object
-        response = JudgeResponse(
-            answer=prediction.answer, reasoning=prediction.reasoning, original_text=text
-        )
+        # Cheapest first: rule-based prefilter, then the verdict cache
+        response = self._prefilter_response(text)
+        if response is None:
+            response = self._cached_response(text)
+
+        if response is None and session_id is not None:
+            # Try the incremental path: re-judge only the appended delta
+            response = self._judge_incremental(text, session_id)
+            if response is not None:
+                self._store_response(response)
+
+        if response is None:
+            # Call the internal assistant
+            prediction = self._call_assistant(
+                self._assistant,
+                text=_normalize_text(text),
+                guardrails=self.guardrails,
+                expertise=self.expertise,
+            )
+            response = JudgeResponse(
+                answer=prediction.answer,
+                reasoning=prediction.reasoning,
+                original_text=text,
+            )
+            # Store the verdict before raising so repeat offenders also hit the cache
+            self._store_response(response)
+
+        # Remember the session snapshot before raising so the next turn
+        # can still judge incrementally
+        if session_id is not None:
+            blocks = _split_blocks(text)
+            self._sessions[session_id] = _SessionState(
+                blocks=blocks, block_hashes=_block_hashes(blocks), verdict=response
+            )
 
         # Raise exception if configured and request is blocked
         if self.raise_on_block and response.blocked:
@@ -185,6 +590,331 @@ class GuardRailz:
 
         return response
 
+    def _judge_incremental(self, text: str, session_id) -> Optional[JudgeResponse]:
+        """
+        Judge text against the session's previous verdict, sending only
+        the appended delta.
+
+        Applies only when the new context shares at least
+        INCREMENTAL_OVERLAP_THRESHOLD of its paragraph-block hashes with
+        the previous one and the unmatched blocks form a contiguous tail.
+        Returns None when the fast path does not apply.
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+
+        blocks = _split_blocks(text)
+        hashes = _block_hashes(blocks)
+        prev_hashes = session.block_hashes
+        if not blocks or not prev_hashes:
+            return None
+
+        overlap = len(set(hashes) & set(prev_hashes)) / len(
+            set(hashes) | set(prev_hashes)
+        )
+        if overlap < self.INCREMENTAL_OVERLAP_THRESHOLD:
+            return None
+        # The unchanged context must be a strict prefix so the delta is a tail
+        if hashes[: len(prev_hashes)] != prev_hashes:
+            return None
+
+        delta_blocks = blocks[len(prev_hashes):]
+        if not delta_blocks:
+            # Context unchanged: the previous verdict still holds
+            return JudgeResponse(
+                answer=session.verdict.answer,
+                reasoning=session.verdict.reasoning,
+                original_text=text,
+            )
+
+        previous_verdict = (
+            f"{'PASS' if session.verdict.answer else 'BLOCK'} "
+            f"because {session.verdict.reasoning}"
+        )
+        prediction = self._call_assistant(
+            self._delta_assistant,
+            previous_verdict=previous_verdict,
+            delta="\n\n".join(delta_blocks),
+            guardrails=self.guardrails,
+            expertise=self.expertise,
+        )
+        return JudgeResponse(
+            answer=prediction.answer,
+            reasoning=prediction.reasoning,
+            original_text=text,
+        )
+
+    def _prefilter_response(self, text: str) -> Optional[JudgeResponse]:
+        """Return a synthetic JudgeResponse if a prefilter rule fires."""
+        if self.prefilter is None:
+            return None
+        verdict = self.prefilter.evaluate(text)
+        if verdict is None:
+            return None
+        answer, reasoning = verdict
+        return JudgeResponse(answer=answer, reasoning=reasoning, original_text=text)
+
+    def _cached_response(self, text: str) -> Optional[JudgeResponse]:
+        """Return the cached JudgeResponse for text, or None on miss."""
+        if self._cache is None:
+            return None
+        key = make_cache_key(self.model, self.expertise, self.guardrails, text)
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        answer, reasoning = cached
+        return JudgeResponse(answer=answer, reasoning=reasoning, original_text=text)
+
+    def _store_response(self, response: JudgeResponse):
+        """Store a freshly judged response in the verdict cache."""
+        if self._cache is None:
+            return
+        key = make_cache_key(
+            self.model, self.expertise, self.guardrails, response.original_text
+        )
+        self._cache.put(key, (response.answer, response.reasoning))
+
+    def _judge_chunk(self, chunk_texts: List[str]) -> List[JudgeResponse]:
+        """
+        Judge one chunk of texts in a single batched LLM call.
+
+        Falls back to judging texts individually if the batch output
+        cannot be parsed into one verdict per input.
+        """
+        try:
+            verdicts = self._call_assistant(
+                self._batch_assistant,
+                texts=[_normalize_text(t) for t in chunk_texts],
+                guardrails=self.guardrails,
+                expertise=self.expertise,
+            )
+            responses = [
+                JudgeResponse(answer=answer, reasoning=reasoning, original_text=text)
+                for (answer, reasoning), text in zip(verdicts, chunk_texts)
+            ]
+        except (TimeoutError, ValueError):
+            # Malformed batch output, or the batched call (which packs
+            # batch_size prompts into the same per-call budget as a
+            # single one) exhausted its timeout: pay per-text calls
+            # rather than guess or fail the whole chunk
+            responses = []
+            for text in chunk_texts:
+                prediction = self._call_assistant(
+                    self._assistant,
+                    text=_normalize_text(text),
+                    guardrails=self.guardrails,
+                    expertise=self.expertise,
+                )
+                responses.append(
+                    JudgeResponse(
+                        answer=prediction.answer,
+                        reasoning=prediction.reasoning,
+                        original_text=text,
+                    )
+                )
+
+        for response in responses:
+            self._store_response(response)
+        return responses
+
+    def judge_many(
+        self, texts: List[str], batch_size: int = 8
+    ) -> List[JudgeResponse]:
+        """
+        Judge many texts, packing several into each LLM call.
+
+        Batching amortizes the shared system/guardrails/expertise prompt
+        prefix across batch_size requests, cutting both request count and
+        total prompt tokens compared to per-text judge() calls. Cached
+        verdicts are reused without any LLM call. Unlike judge(), this
+        never raises BlockedException — callers inspect the responses.
+
+        Args:
+            texts: The user requests/instructions to evaluate
+            batch_size: Number of texts packed into each LLM call
+
+        Returns:
+            List of JudgeResponse in the same order as texts
+
+        Example:
+            >>> g = GuardRailz(expertise="Math")
+            >>> responses = g.judge_many(["What is 2+2?", "What is 3*3?"])
+            >>> [r.answer for r in responses]
+            [True, True]
+        """
+        responses: List[Optional[JudgeResponse]] = [None] * len(texts)
+        pending = self._fill_from_cache(texts, responses)
+        # Group similar-length prompts so one long outlier doesn't stall
+        # a whole chunk; results land by original index regardless
+        pending.sort(key=lambda i: len(texts[i]))
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            chunk_responses = self._judge_chunk([texts[i] for i in chunk])
+            for i, response in zip(chunk, chunk_responses):
+                responses[i] = response
+
+        return responses
+
+    def judge_batch(
+        self, texts: List[str], num_threads: int = 8
+    ) -> List[JudgeResponse]:
+        """
+        Judge many texts via DSPy's threaded batch executor.
+
+        Unlike judge_many(), each text keeps its own LLM call and
+        verdict — the calls are simply dispatched across num_threads
+        worker threads with dspy's Module.batch, which amortizes the
+        serial round-trip latency across the batch. Cached verdicts are
+        reused without any LLM call, and like judge_many() this never
+        raises BlockedException.
+
+        Args:
+            texts: The user requests/instructions to evaluate
+            num_threads: Worker threads used by the batch executor
+
+        Returns:
+            List of JudgeResponse in the same order as texts
+
+        Example:
+            >>> g = GuardRailz(expertise="Math")
+            >>> responses = g.judge_batch(["What is 2+2?", "What is 3*3?"])
+        """
+        responses: List[Optional[JudgeResponse]] = [None] * len(texts)
+        pending = self._fill_from_cache(texts, responses)
+
+        if pending:
+            examples = [
+                dspy.Example(
+                    text=_normalize_text(texts[i]),
+                    guardrails=self.guardrails,
+                    expertise=self.expertise,
+                ).with_inputs("text", "guardrails", "expertise")
+                for i in pending
+            ]
+            predictions = self._assistant.batch(examples, num_threads=num_threads)
+            for i, prediction in zip(pending, predictions):
+                response = JudgeResponse(
+                    answer=prediction.answer,
+                    reasoning=prediction.reasoning,
+                    original_text=texts[i],
+                )
+                self._store_response(response)
+                responses[i] = response
+
+        return responses
+
+    async def ajudge_many(
+        self,
+        texts: List[str],
+        batch_size: int = 8,
+        max_concurrency: int = 16,
+    ) -> List[JudgeResponse]:
+        """
+        Async variant of judge_many(): chunks are dispatched concurrently.
+
+        Each chunk acquires the rate limiter (if configured) before its
+        LLM call, and at most max_concurrency chunks are in flight at
+        once.
+
+        Args:
+            texts: The user requests/instructions to evaluate
+            batch_size: Number of texts packed into each LLM call
+            max_concurrency: Maximum chunks in flight at once
+
+        Returns:
+            List of JudgeResponse in the same order as texts
+        """
+        # Materialize the LM and both assistants on this thread before
+        # fanning out; first-touch on a worker thread would configure
+        # dspy there and break every sibling worker (see lm)
+        self._batch_assistant
+        self._assistant
+
+        responses: List[Optional[JudgeResponse]] = [None] * len(texts)
+        pending = self._fill_from_cache(texts, responses)
+        # Group similar-length prompts so one long outlier doesn't stall
+        # a whole chunk; results land by original index regardless
+        pending.sort(key=lambda i: len(texts[i]))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(chunk):
+            chunk_texts = [texts[i] for i in chunk]
+            async with semaphore:
+                if self._limiter is not None:
+                    await self._limiter.acquire(
+                        self._prefix_tokens + estimate_tokens(*chunk_texts)
+                    )
+                return chunk, await asyncio.to_thread(self._judge_chunk, chunk_texts)
+
+        tasks = [
+            asyncio.create_task(_run(pending[start : start + batch_size]))
+            for start in range(0, len(pending), batch_size)
+        ]
+        for chunk, chunk_responses in await asyncio.gather(*tasks):
+            for i, response in zip(chunk, chunk_responses):
+                responses[i] = response
+
+        return responses
+
+    def _fill_from_cache(self, texts, responses) -> List[int]:
+        """Fill responses with cache hits; return indices still to judge."""
+        pending = []
+        for i, text in enumerate(texts):
+            response = self._prefilter_response(text) or self._cached_response(text)
+            if response is not None:
+                responses[i] = response
+            else:
+                pending.append(i)
+        return pending
+
+    async def ajudge(self, text: str, session_id=None) -> JudgeResponse:
+        """
+        Async variant of judge() for concurrent workloads.
+
+        The underlying DSPy call is synchronous, so it is dispatched to a
+        worker thread; this lets callers fan out many judgments with
+        asyncio.gather without blocking the event loop.
+
+        Args:
+            text: The user's request/instruction to evaluate
+            session_id: Optional session key for incremental judging
+                (see judge())
+
+        Returns:
+            JudgeResponse with answer (bool) and reasoning (str)
+
+        Raises:
+            BlockedException: If raise_on_block is True and request is blocked
+
+        Example:
+            >>> g = GuardRailz(expertise="Math")
+            >>> response = asyncio.run(g.ajudge("What is 2+2?"))
+        """
+        # Materialize the LM and the assistants judge() can reach on this
+        # thread before the worker-thread hop; first-touch on a worker
+        # would configure dspy there and break every sibling (see lm)
+        self._assistant
+        if session_id is not None:
+            self._delta_assistant
+
+        if self._limiter is not None:
+            await self._limiter.acquire(
+                self._prefix_tokens + estimate_tokens(text)
+            )
+        try:
+            return await asyncio.to_thread(self.judge, text, session_id)
+        except BlockedException:
+            raise
+        except Exception as e:
+            # On a 429 the advertised ceiling is optimistic: shrink the
+            # buckets (and honor Retry-After) so subsequent calls back off
+            # proactively instead of retrying blind.
+            if self._limiter is not None and _is_rate_limit_error(e):
+                self._limiter.throttle(_retry_after_seconds(e))
+            raise
+
     def check(self, text: str) -> bool:
         """
         Quick boolean check if text passes guardrails.
@@ -206,6 +936,24 @@ class GuardRailz:
         except BlockedException:
             return False
 
+    def cache_stats(self) -> dict:
+        """
+        Return verdict-cache statistics.
+
+        Returns:
+            Dict with hits, misses, size, capacity and hit_rate
+            (all zero if caching is disabled)
+
+        Example:
+            >>> g = GuardRailz()
+            >>> g.judge("What is 2+2?")
+            >>> g.cache_stats()["misses"]
+            1
+        """
+        if self._cache is None:
+            return {"hits": 0, "misses": 0, "size": 0, "capacity": 0, "hit_rate": 0.0}
+        return self._cache.stats()
+
     def raise_for_guardrail(self):
         """
         Enable exception-based mode.
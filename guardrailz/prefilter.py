@@ -0,0 +1,158 @@
+"""
+Fast-path prefiltering for the guardrails judge.
+
+Many prompts are trivially classifiable — an obvious slur, an obvious
+on-topic keyword — and don't need an LLM round-trip at all. A prefilter
+holds two rule lists (pass and block); when a rule matches, judge()
+returns a synthetic verdict in microseconds and the LLM is never
+called. Ambiguous prompts fall through to the normal judge path.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+
+class PrefilterSet:
+    """
+    Regex-based prefilter with separate pass and block rule lists.
+
+    Patterns are compiled once (case-insensitive) at construction.
+    Block rules are checked before pass rules so a prompt matching both
+    is blocked.
+
+    Example:
+        >>> pf = PrefilterSet(
+        ...     pass_patterns=[r"\\b(derivative|integral|equation)\\b"],
+        ...     block_patterns=[r"\\bhow to hack\\b"],
+        ... )
+        >>> g = GuardRailz(expertise="Mathematics", prefilter=pf)
+    """
+
+    def __init__(
+        self,
+        pass_patterns: Optional[List[str]] = None,
+        block_patterns: Optional[List[str]] = None,
+    ):
+        """
+        Initialize PrefilterSet.
+
+        Args:
+            pass_patterns: Regexes whose match means the text clearly passes
+            block_patterns: Regexes whose match means the text clearly blocks
+        """
+        self.pass_patterns = [
+            re.compile(p, re.IGNORECASE) for p in (pass_patterns or [])
+        ]
+        self.block_patterns = [
+            re.compile(p, re.IGNORECASE) for p in (block_patterns or [])
+        ]
+
+    def evaluate(self, text: str) -> Optional[Tuple[bool, str]]:
+        """
+        Evaluate text against the rule lists.
+
+        Args:
+            text: The text to classify
+
+        Returns:
+            (answer, reasoning) when a rule fires, None when no rule
+            matches and the LLM judge should decide
+        """
+        for pattern in self.block_patterns:
+            if pattern.search(text):
+                return False, f"prefilter: matched block rule {pattern.pattern!r}"
+        for pattern in self.pass_patterns:
+            if pattern.search(text):
+                return True, f"prefilter: matched pass rule {pattern.pattern!r}"
+        return None
+
+
+class HyperscanPrefilter:
+    """
+    Prefilter backed by Hyperscan for large rule sets.
+
+    Hyperscan compiles all patterns into a single DFA, so matching is
+    O(text length) regardless of rule count — worthwhile once rule sets
+    grow into the thousands. Requires the optional `hyperscan` package.
+    """
+
+    def __init__(
+        self,
+        pass_patterns: Optional[List[str]] = None,
+        block_patterns: Optional[List[str]] = None,
+    ):
+        """
+        Initialize HyperscanPrefilter.
+
+        Args:
+            pass_patterns: Regexes whose match means the text clearly passes
+            block_patterns: Regexes whose match means the text clearly blocks
+
+        Raises:
+            ImportError: If the hyperscan package is not installed
+        """
+        try:
+            import hyperscan
+        except ImportError as e:
+            raise ImportError(
+                "HyperscanPrefilter requires the 'hyperscan' package "
+                "(pip install hyperscan); use PrefilterSet for small rule sets."
+            ) from e
+
+        self._hyperscan = hyperscan
+        self.pass_patterns = list(pass_patterns or [])
+        self.block_patterns = list(block_patterns or [])
+        self._pass_db = self._compile(hyperscan, self.pass_patterns)
+        self._block_db = self._compile(hyperscan, self.block_patterns)
+
+    @staticmethod
+    def _compile(hyperscan, patterns):
+        if not patterns:
+            return None
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode("utf-8") for p in patterns],
+            ids=list(range(len(patterns))),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(patterns),
+        )
+        return db
+
+    def _scan(self, db, text: str) -> Optional[int]:
+        """Return the id of the first matching pattern, or None."""
+        if db is None:
+            return None
+        matched = []
+
+        def _on_match(pattern_id, start, end, flags, context):
+            matched.append(pattern_id)
+            return 1  # stop scanning at the first match
+
+        try:
+            db.scan(text.encode("utf-8"), match_event_handler=_on_match)
+        except self._hyperscan.ScanTerminated:
+            # Raised when the callback halts the scan early, i.e. a
+            # match was found — not an error
+            pass
+        return matched[0] if matched else None
+
+    def evaluate(self, text: str) -> Optional[Tuple[bool, str]]:
+        """
+        Evaluate text against the rule databases.
+
+        Args:
+            text: The text to classify
+
+        Returns:
+            (answer, reasoning) when a rule fires, None otherwise
+        """
+        block_id = self._scan(self._block_db, text)
+        if block_id is not None:
+            return False, (
+                f"prefilter: matched block rule {self.block_patterns[block_id]!r}"
+            )
+        pass_id = self._scan(self._pass_db, text)
+        if pass_id is not None:
+            return True, (
+                f"prefilter: matched pass rule {self.pass_patterns[pass_id]!r}"
+            )
+        return None
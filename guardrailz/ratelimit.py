@@ -0,0 +1,170 @@
+"""
+Proactive rate limiting for concurrent judge calls.
+
+Provides an async token-bucket limiter with two buckets (requests per
+minute and tokens per minute) so batched workloads throttle themselves
+before the provider returns 429s, instead of burning round-trips on
+blind exponential backoff.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+# Rough chars-per-token ratio used to estimate prompt token counts
+CHARS_PER_TOKEN = 4
+
+# Fixed margin added to every estimate to cover templating and completion tokens
+TOKEN_ESTIMATE_MARGIN = 200
+
+
+def estimate_tokens(*texts: str) -> int:
+    """
+    Estimate the token cost of an LLM call from its prompt components.
+
+    Uses the common ~4 characters/token heuristic plus a fixed margin
+    for prompt templating and the completion.
+
+    Args:
+        *texts: Prompt components (text, guardrails, expertise, ...)
+
+    Returns:
+        Estimated token count
+    """
+    return sum(len(t) // CHARS_PER_TOKEN for t in texts) + TOKEN_ESTIMATE_MARGIN
+
+
+def count_prefix_tokens(model: str, *texts: str) -> int:
+    """
+    Count the tokens of a constant prompt prefix, exactly if possible.
+
+    Intended for strings that are fixed for the lifetime of a GuardRailz
+    instance (guardrails, expertise), where a one-time exact count via
+    tiktoken is worth it and makes per-call rate-limit accounting free.
+    Falls back to the chars/token heuristic when tiktoken is not
+    installed or does not know the model.
+
+    Args:
+        model: Model identifier (provider prefixes are stripped)
+        *texts: The constant prompt components to count
+
+    Returns:
+        Token count for the concatenated texts (no completion margin)
+    """
+    prefix = "".join(texts)
+    try:
+        import tiktoken
+
+        encoding = tiktoken.encoding_for_model(model.rsplit("/", 1)[-1])
+        return len(encoding.encode(prefix))
+    except (ImportError, KeyError):
+        return len(prefix) // CHARS_PER_TOKEN
+
+
+class _TokenBucket:
+    """A single token bucket refilled continuously at capacity/60 per second."""
+
+    def __init__(self, capacity: float):
+        self.capacity = float(capacity)
+        self.initial_capacity = float(capacity)
+        self.level = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(
+            self.capacity, self.level + (now - self.updated) * (self.capacity / 60.0)
+        )
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` is available (0 if available now)."""
+        self._refill()
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / (self.capacity / 60.0)
+
+    def take(self, amount: float):
+        """Deduct `amount` from the bucket (may go briefly negative)."""
+        self._refill()
+        self.level -= amount
+
+
+class RateLimiter:
+    """
+    Async rate limiter with request-per-minute and token-per-minute buckets.
+
+    Callers acquire() before each LLM call; the limiter sleeps just long
+    enough for both buckets to cover the request, keeping throughput near
+    the provider ceiling without triggering 429 retry storms.
+
+    Example:
+        >>> limiter = RateLimiter(rpm=500, tpm=200_000)
+        >>> await limiter.acquire(est_tokens=350)
+    """
+
+    # Factor applied to bucket capacity when the provider still returns 429
+    BACKOFF_FACTOR = 0.8
+
+    # Minimum fraction of the original capacity the limiter will shrink to
+    MIN_CAPACITY_FRACTION = 0.1
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        """
+        Initialize RateLimiter.
+
+        Args:
+            rpm: Maximum requests per minute (None = unlimited)
+            tpm: Maximum tokens per minute (None = unlimited)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = _TokenBucket(rpm) if rpm else None
+        self._tokens = _TokenBucket(tpm) if tpm else None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, est_tokens: int = 0):
+        """
+        Block until both buckets can cover one request of est_tokens tokens.
+
+        Args:
+            est_tokens: Estimated token cost of the upcoming call
+        """
+        async with self._lock:
+            while True:
+                wait = 0.0
+                if self._requests is not None:
+                    wait = max(wait, self._requests.wait_time(1))
+                if self._tokens is not None and est_tokens:
+                    wait = max(wait, self._tokens.wait_time(est_tokens))
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            if self._requests is not None:
+                self._requests.take(1)
+            if self._tokens is not None and est_tokens:
+                self._tokens.take(est_tokens)
+
+    def throttle(self, retry_after: Optional[float] = None):
+        """
+        React to a provider 429 by shrinking bucket capacity.
+
+        Call this when a call still hits the rate limit; the advertised
+        ceiling is evidently optimistic, so capacity is lowered toward the
+        observed sustainable rate. If the response carried a Retry-After
+        header, the buckets are also drained for that long.
+
+        Args:
+            retry_after: Seconds from the response's Retry-After header, if any
+        """
+        for bucket in (self._requests, self._tokens):
+            if bucket is None:
+                continue
+            bucket.capacity = max(
+                bucket.capacity * self.BACKOFF_FACTOR,
+                bucket.initial_capacity * self.MIN_CAPACITY_FRACTION,
+            )
+            if retry_after:
+                # Drain the bucket so acquire() sleeps through the penalty window
+                bucket.level = -retry_after * (bucket.capacity / 60.0)
@@ -26,3 +26,91 @@ class GuardrailsJudgeSignature(dspy.Signature):
     reasoning = dspy.OutputField(
         desc="A brief justification for the decision to answer or block the request."
     )
+
+
+class FusedGuardrailsJudgeSignature(dspy.Signature):
+    """
+    DSPy signature judging a request against a pre-rendered context.
+
+    The guardrails and expertise are constant per GuardRailz instance,
+    so they arrive fused into a single context field rendered once
+    instead of being re-templated on every call.
+    """
+
+    context = dspy.InputField(
+        desc="The assistant's area of expertise followed by the safety rules and constraints that determine acceptable vs unacceptable requests"
+    )
+    text = dspy.InputField(desc="User's instruction or request to the assistant")
+
+    answer = dspy.OutputField(
+        desc="A Boolean string: 'true' if the request should be answered, 'false' if the request should be blocked"
+    )
+    reasoning = dspy.OutputField(
+        desc="A brief justification for the decision to answer or block the request."
+    )
+
+
+class DeltaGuardrailsJudgeSignature(dspy.Signature):
+    """
+    DSPy signature for re-judging a context that grew by a small delta.
+
+    Conversational callers send contexts that mostly overlap with the
+    previous turn; judging only the appended delta against the previous
+    verdict avoids re-sending the unchanged portion.
+
+    The per-instance-constant fields come first so the rendered prompt
+    starts with an identical prefix across calls, letting the provider's
+    prompt-prefix cache skip re-prefilling it.
+    """
+
+    guardrails = dspy.InputField(
+        desc="Safety rules and constraints that determine acceptable vs unacceptable requests"
+    )
+    expertise = dspy.InputField(
+        desc="The area of expertise that the assistant is knowledgeable about"
+    )
+    previous_verdict = dspy.InputField(
+        desc="The verdict (PASS/BLOCK) and reasoning for the earlier, unchanged portion of this context"
+    )
+    delta = dspy.InputField(
+        desc="The newly appended portion of the user's context to re-judge in light of the previous verdict"
+    )
+
+    answer = dspy.OutputField(
+        desc="A Boolean string: 'true' if the full context should be answered, 'false' if it should be blocked"
+    )
+    reasoning = dspy.OutputField(
+        desc="A brief justification for the decision to answer or block the request."
+    )
+
+
+class BatchGuardrailsJudgeSignature(dspy.Signature):
+    """
+    DSPy signature for judging several requests in one LLM call.
+
+    Packing multiple requests into a single call amortizes the shared
+    system/guardrails/expertise prompt prefix across the whole batch.
+
+    The per-instance-constant fields come first so the rendered prompt
+    starts with an identical prefix across calls, letting the provider's
+    prompt-prefix cache skip re-prefilling it.
+    """
+
+    guardrails = dspy.InputField(
+        desc="Safety rules and constraints that determine acceptable vs unacceptable requests"
+    )
+    expertise = dspy.InputField(
+        desc="The area of expertise that the assistant is knowledgeable about"
+    )
+    texts = dspy.InputField(
+        desc="A JSON array of user requests; judge each one independently"
+    )
+
+    verdicts = dspy.OutputField(
+        desc=(
+            "A JSON array with exactly one object per input request, in the same "
+            'order, each of the form {"answer": true|false, "reasoning": "..."} '
+            "where answer is true if the request should be answered and false if "
+            "it should be blocked"
+        )
+    )
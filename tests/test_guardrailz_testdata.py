@@ -3,39 +3,71 @@ Test suite for GuardRailz using testdata CSV files.
 
 This test suite verifies that GuardRailz correctly judges all test cases
 in the testdata directory, achieving 100% match rate on expected results.
+
+The judge model is read from the GUARDRAILZ_MODEL environment variable
+(default: openrouter/openai/gpt-4o-mini), so the whole suite can be
+rerouted to a faster or higher-rate-limit judge with a single env var.
 """
 
+import asyncio
 import csv
+import hashlib
+import json
+import logging
+import os
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, Tuple
+
+from guardrailz import GuardRailz, JudgeResponse
+
+# Maximum judge calls in flight at once. Each ajudge call occupies one
+# worker in GuardRailz's timeout executor, so a wider window would only
+# queue inside GuardRailz rather than add real concurrency — size the
+# window to that executor and let it bound the run
+MAX_IN_FLIGHT = GuardRailz.TIMEOUT_EXECUTOR_WORKERS
 
-from guardrailz import GuardRailz
+# Judge model for all suites; override via env to reroute the whole run
+# to a faster or higher-rate-limit endpoint
+TEST_MODEL = os.environ.get("GUARDRAILZ_MODEL", "openrouter/openai/gpt-4o-mini")
+
+# Per-case verbose output goes through here so it can be silenced (set to
+# WARNING) without paying the stdout print-lock per judged case
+logger = logging.getLogger("guardrailz.tests")
 
 
 class TestResults:
-    """Track test results."""
+    """Track test results. Safe to update from multiple threads."""
 
     def __init__(self, test_name: str):
         self.test_name = test_name
         self.total = 0
         self.correct = 0
         self.incorrect = 0
-        self.failures = []
+        # Failures as parallel columns rather than a list of dicts; at
+        # large failure counts this is a few references per entry
+        # instead of a dict with four string keys
+        self.failure_instructions = []
+        self.failure_expected = []
+        self.failure_actual = []
+        self.failure_reasoning = []
+        self._lock = threading.Lock()
 
     def add_result(self, instruction: str, expected: bool, actual: bool, reasoning: str):
         """Add a test result."""
-        self.total += 1
-        if expected == actual:
-            self.correct += 1
-        else:
-            self.incorrect += 1
-            self.failures.append({
-                'instruction': instruction,
-                'expected': expected,
-                'actual': actual,
-                'reasoning': reasoning
-            })
+        with self._lock:
+            self.total += 1
+            if expected == actual:
+                self.correct += 1
+            else:
+                self.incorrect += 1
+                self.failure_instructions.append(instruction)
+                self.failure_expected.append(expected)
+                self.failure_actual.append(actual)
+                self.failure_reasoning.append(reasoning)
 
     def accuracy(self) -> float:
         """Calculate accuracy percentage."""
@@ -44,50 +76,206 @@ class TestResults:
         return (self.correct / self.total) * 100
 
     def print_summary(self):
-        """Print test summary."""
-        print(f"\n{'='*80}")
-        print(f"Test: {self.test_name}")
-        print(f"{'='*80}")
-        print(f"Total:    {self.total}")
-        print(f"Correct:  {self.correct} ({self.accuracy():.1f}%)")
-        print(f"Incorrect: {self.incorrect}")
-
-        if self.failures:
-            print(f"\n{'='*80}")
-            print(f"FAILURES:")
-            print(f"{'='*80}")
-            for i, failure in enumerate(self.failures, 1):
-                print(f"\n{i}. Instruction: {failure['instruction'][:70]}...")
-                print(f"   Expected: {'PASS' if failure['expected'] else 'BLOCK'}")
-                print(f"   Actual:   {'PASS' if failure['actual'] else 'BLOCK'}")
-                print(f"   Reasoning: {failure['reasoning'][:100]}...")
+        """Print test summary as a single buffered stdout write."""
+        lines = [
+            f"\n{'='*80}",
+            f"Test: {self.test_name}",
+            f"{'='*80}",
+            f"Total:    {self.total}",
+            f"Correct:  {self.correct} ({self.accuracy():.1f}%)",
+            f"Incorrect: {self.incorrect}",
+        ]
+
+        if self.failure_instructions:
+            lines.append(f"\n{'='*80}")
+            lines.append("FAILURES:")
+            lines.append(f"{'='*80}")
+            failures = zip(
+                self.failure_instructions,
+                self.failure_expected,
+                self.failure_actual,
+                self.failure_reasoning,
+            )
+            for i, (instruction, expected, actual, reasoning) in enumerate(failures, 1):
+                lines.append(f"\n{i}. Instruction: {instruction[:70]}...")
+                lines.append(f"   Expected: {'PASS' if expected else 'BLOCK'}")
+                lines.append(f"   Actual:   {'PASS' if actual else 'BLOCK'}")
+                lines.append(f"   Reasoning: {reasoning[:100]}...")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def is_passing(self) -> bool:
         """Check if all tests passed."""
         return self.incorrect == 0
 
 
-def load_test_data(csv_path: Path) -> List[Tuple[str, str, bool]]:
+# Accepted spellings of a truthy should_answer cell; avoids a per-row .lower()
+_TRUTHY = frozenset({'true', 'True', 'TRUE'})
+
+
+def load_test_data(csv_path: Path) -> Iterator[Tuple[str, str, bool]]:
+    """
+    Stream test data from CSV file.
+
+    Uses csv.reader with column indices computed once from the header
+    instead of DictReader's per-row dict allocation, and yields rows as
+    they parse so dispatch can start before the whole file is read. A
+    1 MiB read buffer keeps syscall count low on large files.
+
+    Yields:
+        Tuples of (category, instruction, should_answer)
+    """
+    with open(csv_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        ci = header.index('category')
+        ii = header.index('instruction')
+        sai = header.index('should_answer')
+        for row in reader:
+            yield (row[ci], row[ii], row[sai] in _TRUTHY)
+
+
+def _checkpoint_key(g: GuardRailz, instruction: str) -> str:
+    """
+    16-byte BLAKE2b hex digest keying a checkpoint entry.
+
+    Keyed on (model, expertise, guardrails, instruction) — like the
+    in-process verdict cache — so suites sharing a checkpoint file never
+    reuse a verdict judged under different guardrails for the same
+    instruction.
+    """
+    payload = "\x1f".join([g.model, g.expertise, g.guardrails, instruction])
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _load_checkpoint(path):
     """
-    Load test data from CSV file.
+    Load prior verdicts from a checkpoint JSONL file.
 
     Returns:
-        List of tuples: (category, instruction, should_answer)
+        Dict mapping instruction hash to (answer, reasoning); empty if
+        the file does not exist yet
     """
-    test_cases = []
+    seen = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                seen[record['hash']] = (record['answer'], record['reasoning'])
+    return seen
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            category = row['category']
-            instruction = row['instruction']
-            should_answer = row['should_answer'].lower() == 'true'
-            test_cases.append((category, instruction, should_answer))
 
-    return test_cases
+# Bin width (in characters) for grouping test cases by instruction length
+LENGTH_BIN_WIDTH = 128
+
 
+def bin_by_length(test_cases):
+    """
+    Group test cases into length bins and yield them bin by bin.
+
+    Judge latency scales with prompt length, so a dispatch window mixing
+    short and long instructions stalls on its longest member. Binning by
+    len(instruction) // LENGTH_BIN_WIDTH keeps each in-flight window
+    filled with similarly-sized requests (multi-bin batching).
+    """
+    bins = defaultdict(list)
+    for test_case in test_cases:
+        bins[len(test_case[1]) // LENGTH_BIN_WIDTH].append(test_case)
+    for bin_key in sorted(bins):
+        yield from bins[bin_key]
 
-def test_cybersecurity(verbose: bool = False):
+
+def run_cases(g: GuardRailz, test_cases, results: TestResults, verbose: bool = False,
+              checkpoint_path: str = None):
+    """
+    Judge test cases concurrently and record the outcomes.
+
+    Keeps a steady window of MAX_IN_FLIGHT GuardRailz.ajudge tasks:
+    the window is seeded up-front and one new case is submitted each
+    time a task completes, so the provider's concurrency budget stays
+    saturated without ever materializing a task per CSV row.
+
+    Rows with identical instructions are judged once — the verdict fans
+    out to every duplicate row — so repeated prompts in the CSV cost one
+    LLM call instead of one per occurrence.
+
+    With checkpoint_path set, each fresh verdict is appended to a JSONL
+    checkpoint as it arrives and verdicts already in the file are reused
+    without an LLM call, so a run aborted by rate limits or timeouts can
+    be resumed without re-paying for its completed cases.
+    """
+    logger.setLevel(logging.INFO if verbose else logging.WARNING)
+
+    seen = _load_checkpoint(checkpoint_path) if checkpoint_path else {}
+    checkpoint = (
+        open(checkpoint_path, 'a', encoding='utf-8') if checkpoint_path else None
+    )
+
+    async def _run_one(instruction, rows):
+        cached = seen.get(_checkpoint_key(g, instruction)) if seen else None
+        if cached is not None:
+            answer, reasoning = cached
+            response = JudgeResponse(
+                answer=answer, reasoning=reasoning, original_text=instruction
+            )
+        else:
+            response = await g.ajudge(instruction)
+            if checkpoint is not None:
+                checkpoint.write(json.dumps({
+                    'hash': _checkpoint_key(g, instruction),
+                    'answer': response.answer,
+                    'reasoning': response.reasoning,
+                }) + '\n')
+                checkpoint.flush()
+        for category, expected in rows:
+            results.add_result(instruction, expected, response.answer, response.reasoning)
+
+            if logger.isEnabledFor(logging.INFO):
+                match = "✅" if expected == response.answer else "❌"
+                logger.info("%s Expected: %s, Got: %s", match, expected, response.answer)
+
+    async def _run_all():
+        # ajudge runs the sync judge via to_thread on the loop's default
+        # executor, whose default cap (min(32, cpus + 4)) can undercut
+        # the window; size it to match so MAX_IN_FLIGHT judgments are
+        # genuinely concurrent
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=MAX_IN_FLIGHT)
+        )
+
+        # instruction -> [(category, expected), ...]; preserves first-seen
+        # (length-binned) order while collapsing duplicates
+        groups = {}
+        for category, instruction, expected in test_cases:
+            groups.setdefault(instruction, []).append((category, expected))
+
+        case_iter = iter(groups.items())
+        in_progress = set()
+
+        def _submit_next():
+            test_case = next(case_iter, None)
+            if test_case is not None:
+                in_progress.add(asyncio.create_task(_run_one(*test_case)))
+
+        for _ in range(MAX_IN_FLIGHT):
+            _submit_next()
+
+        while in_progress:
+            done, in_progress = await asyncio.wait(
+                in_progress, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()  # propagate judge errors
+                _submit_next()
+
+    try:
+        asyncio.run(_run_all())
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+
+def test_cybersecurity(verbose: bool = False, resume: str = None):
     """Test cybersecurity guardrails."""
     print("\n" + "="*80)
     print("TEST: Cybersecurity Guardrails")
@@ -97,7 +285,7 @@ def test_cybersecurity(verbose: bool = False):
     testdata_path = Path(__file__).parent / "testdata" / "cybersecurity_tests.csv"
     test_cases = load_test_data(testdata_path)
 
-    print(f"\nLoaded {len(test_cases)} test cases from {testdata_path.name}")
+    print(f"\nLoading test cases from {testdata_path.name}")
 
     # Initialize GuardRailz with cybersecurity expertise
     guardrails = """
@@ -110,25 +298,15 @@ def test_cybersecurity(verbose: bool = False):
     g = GuardRailz(
         expertise="Cybersecurity and Information Security",
         guardrails=guardrails,
-        model="openrouter/openai/gpt-4o-mini"
+        model=TEST_MODEL
     )
 
     # Track results
     results = TestResults("Cybersecurity Tests")
 
-    # Test each case
-    for category, instruction, expected_answer in test_cases:
-        if verbose:
-            print(f"\nTesting: {instruction[:60]}...")
-
-        response = g.judge(instruction)
-        actual_answer = response.answer
-
-        results.add_result(instruction, expected_answer, actual_answer, response.reasoning)
-
-        if verbose:
-            match = "✅" if expected_answer == actual_answer else "❌"
-            print(f"{match} Expected: {expected_answer}, Got: {actual_answer}")
+    # Judge all cases concurrently
+    run_cases(g, bin_by_length(test_cases), results, verbose=verbose,
+              checkpoint_path=resume)
 
     # Print summary
     results.print_summary()
@@ -136,7 +314,7 @@ def test_cybersecurity(verbose: bool = False):
     return results
 
 
-def test_bass_fishing(verbose: bool = False):
+def test_bass_fishing(verbose: bool = False, resume: str = None):
     """Test bass fishing guardrails."""
     print("\n" + "="*80)
     print("TEST: Bass Fishing Guardrails")
@@ -146,7 +324,7 @@ def test_bass_fishing(verbose: bool = False):
     testdata_path = Path(__file__).parent / "testdata" / "bass_fishing_tests.csv"
     test_cases = load_test_data(testdata_path)
 
-    print(f"\nLoaded {len(test_cases)} test cases from {testdata_path.name}")
+    print(f"\nLoading test cases from {testdata_path.name}")
 
     # Initialize GuardRailz with bass fishing expertise
     guardrails = """
@@ -160,25 +338,15 @@ def test_bass_fishing(verbose: bool = False):
     g = GuardRailz(
         expertise="Bass Fishing",
         guardrails=guardrails,
-        model="openrouter/openai/gpt-4o-mini"
+        model=TEST_MODEL
     )
 
     # Track results
     results = TestResults("Bass Fishing Tests")
 
-    # Test each case
-    for category, instruction, expected_answer in test_cases:
-        if verbose:
-            print(f"\nTesting: {instruction[:60]}...")
-
-        response = g.judge(instruction)
-        actual_answer = response.answer
-
-        results.add_result(instruction, expected_answer, actual_answer, response.reasoning)
-
-        if verbose:
-            match = "✅" if expected_answer == actual_answer else "❌"
-            print(f"{match} Expected: {expected_answer}, Got: {actual_answer}")
+    # Judge all cases concurrently
+    run_cases(g, bin_by_length(test_cases), results, verbose=verbose,
+              checkpoint_path=resume)
 
     # Print summary
     results.print_summary()
@@ -186,7 +354,7 @@ def test_bass_fishing(verbose: bool = False):
     return results
 
 
-def test_all_testdata(verbose: bool = False):
+def test_all_testdata(verbose: bool = False, resume: str = None):
     """Run all testdata tests."""
     print("\n" + "="*80)
     print("GUARDRAILZ TESTDATA TEST SUITE")
@@ -195,11 +363,11 @@ def test_all_testdata(verbose: bool = False):
     all_results = []
 
     # Test cybersecurity
-    cyber_results = test_cybersecurity(verbose=verbose)
+    cyber_results = test_cybersecurity(verbose=verbose, resume=resume)
     all_results.append(cyber_results)
 
     # Test bass fishing
-    bass_results = test_bass_fishing(verbose=verbose)
+    bass_results = test_bass_fishing(verbose=verbose, resume=resume)
     all_results.append(bass_results)
 
     # Overall summary
@@ -255,18 +423,27 @@ def main():
         default='all',
         help='Which test suite to run (default: all)'
     )
+    parser.add_argument(
+        '--resume',
+        metavar='PATH',
+        default=None,
+        help='Checkpoint JSONL file; completed cases found in it are '
+             'skipped and new verdicts are appended as they arrive'
+    )
 
     args = parser.parse_args()
 
+    logging.basicConfig(format="%(message)s")
+
     try:
         if args.test == 'cybersecurity':
-            results = test_cybersecurity(verbose=args.verbose)
+            results = test_cybersecurity(verbose=args.verbose, resume=args.resume)
             return 0 if results.is_passing() else 1
         elif args.test == 'bass_fishing':
-            results = test_bass_fishing(verbose=args.verbose)
+            results = test_bass_fishing(verbose=args.verbose, resume=args.resume)
             return 0 if results.is_passing() else 1
         else:
-            return test_all_testdata(verbose=args.verbose)
+            return test_all_testdata(verbose=args.verbose, resume=args.resume)
 
     except Exception as e:
         print(f"\n❌ ERROR: {e}")